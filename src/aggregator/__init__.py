@@ -1,5 +1,5 @@
 from .collector import Collector
-from .deduplicator import Deduplicator
+from .deduplicator import Deduplicator, DeduplicationIndex
 from .summarizer import Summarizer
 from .translator import Translator
 from .pipeline import NewsPipeline
@@ -7,6 +7,7 @@ from .pipeline import NewsPipeline
 __all__ = [
     "Collector",
     "Deduplicator",
+    "DeduplicationIndex",
     "Summarizer",
     "Translator",
     "NewsPipeline",
@@ -1,5 +1,8 @@
-from typing import List, Set
+from typing import Dict, List, Set, Tuple
 from difflib import SequenceMatcher
+import re
+
+from datasketch import MinHash, MinHashLSH
 
 from ..storage.models import RawArticle
 from ..utils.logger import get_logger
@@ -7,38 +10,42 @@ from ..utils.logger import get_logger
 
 logger = get_logger("deduplicator")
 
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
+
+def _sort_key(article: RawArticle):
+    """Sort key: publication time, falling back to fetch time."""
+    return article.published_at or article.fetched_at
+
 
 class Deduplicator:
     """Removes duplicate articles based on URL and title similarity."""
 
-    def __init__(self, similarity_threshold: float = 0.85):
+    def __init__(
+        self,
+        similarity_threshold: float = 0.85,
+        lsh_threshold: float = 0.5,
+        num_perm: int = 128,
+        shingle_size: int = 3,
+        max_word_diff: int = 5
+    ):
         self.similarity_threshold = similarity_threshold
+        self.lsh_threshold = lsh_threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.max_word_diff = max_word_diff
+        # Generating permutations dominates MinHash construction, so every
+        # signature starts as a copy of one empty template (which also
+        # carries over the permutation scheme on datasketch 2.x)
+        self._template = MinHash(num_perm=num_perm)
 
     def deduplicate(self, articles: List[RawArticle]) -> List[RawArticle]:
         """Remove duplicate articles."""
-        if not articles:
-            return []
-
-        seen_urls: Set[str] = set()
-        seen_titles: List[str] = []
-        unique_articles: List[RawArticle] = []
-
-        sorted_articles = sorted(
-            articles,
-            key=lambda a: a.published_at or a.fetched_at,
-            reverse=True
-        )
-
-        for article in sorted_articles:
-            if article.url in seen_urls:
-                continue
-
-            if self._is_similar_title(article.title, seen_titles):
-                continue
+        if len(articles) < 2:
+            return list(articles)
 
-            seen_urls.add(article.url)
-            seen_titles.append(article.title)
-            unique_articles.append(article)
+        unique_articles = self.create_index().add(articles)
 
         removed = len(articles) - len(unique_articles)
         if removed > 0:
@@ -46,24 +53,95 @@ class Deduplicator:
 
         return unique_articles
 
+    def create_index(self) -> "DeduplicationIndex":
+        """Create an empty index for deduplicating articles batch by batch."""
+        return DeduplicationIndex(self)
+
+    def _minhash(self, title_norm: str) -> MinHash:
+        """Build a MinHash signature from character shingles of a title."""
+        minhash = self._template.copy()
+        size = self.shingle_size
+
+        if len(title_norm) <= size:
+            minhash.update(title_norm.encode("utf-8"))
+            return minhash
+
+        minhash.update_batch(
+            title_norm[i:i + size].encode("utf-8")
+            for i in range(len(title_norm) - size + 1)
+        )
+
+        return minhash
+
     def _is_similar_title(self, title: str, seen_titles: List[str]) -> bool:
-        """Check if title is similar to any seen title."""
-        title_lower = title.lower().strip()
+        """Check if title is similar to any of the candidate titles."""
+        threshold = self.similarity_threshold
 
         for seen in seen_titles:
-            similarity = SequenceMatcher(
-                None, title_lower, seen.lower().strip()
-            ).ratio()
+            matcher = SequenceMatcher(None, title, seen, autojunk=False)
 
-            if similarity >= self.similarity_threshold:
+            # Cheap upper bounds first, full ratio() only if they pass
+            if matcher.real_quick_ratio() < threshold:
+                continue
+            if matcher.quick_ratio() < threshold:
+                continue
+            if matcher.ratio() >= threshold:
                 return True
 
         return False
 
     def _normalize_title(self, title: str) -> str:
         """Normalize title for comparison."""
-        import re
-        title = title.lower()
-        title = re.sub(r'[^\w\s]', '', title)
-        title = ' '.join(title.split())
-        return title
+        return _WS_RE.sub(" ", _PUNCT_RE.sub("", title.lower())).strip()
+
+
+class DeduplicationIndex:
+    """Accepted articles so far, used to reject duplicates in later batches."""
+
+    def __init__(self, deduplicator: Deduplicator):
+        self.deduplicator = deduplicator
+        self._lsh = MinHashLSH(
+            threshold=deduplicator.lsh_threshold,
+            num_perm=deduplicator.num_perm
+        )
+        self._seen_urls: Set[str] = set()
+        self._seen_titles: Dict[str, Tuple[str, int]] = {}
+
+    def add(self, articles: List[RawArticle]) -> List[RawArticle]:
+        """Index a batch and return its articles that are not duplicates.
+
+        Within a batch the newest article wins; across batches the one
+        added first wins.
+        """
+        dedup = self.deduplicator
+        seen_urls = self._seen_urls
+        seen_titles = self._seen_titles
+        unique_articles: List[RawArticle] = []
+
+        sorted_articles = sorted(articles, key=_sort_key, reverse=True)
+
+        for article in sorted_articles:
+            if article.url in seen_urls:
+                continue
+
+            title_norm = dedup._normalize_title(article.title)
+            word_count = len(title_norm.split())
+            minhash = dedup._minhash(title_norm)
+
+            # Titles whose word counts differ too much are never near-duplicates
+            candidates = [
+                seen
+                for seen, seen_wc in (seen_titles[key] for key in self._lsh.query(minhash))
+                if abs(seen_wc - word_count) <= dedup.max_word_diff
+            ]
+
+            if dedup._is_similar_title(title_norm, candidates):
+                continue
+
+            key = str(len(seen_titles))
+            self._lsh.insert(key, minhash)
+            seen_titles[key] = (title_norm, word_count)
+            seen_urls.add(article.url)
+            unique_articles.append(article)
+
+        return unique_articles
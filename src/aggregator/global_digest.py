@@ -2,20 +2,26 @@
 
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from itertools import chain
 
-from ..storage.models import RawArticle, ProcessedDigest
+from ..storage.models import RawArticle, ProcessedDigest, LLMArticleRow
 from ..storage.database import Database
-from ..llm.client import LLMClient
-from ..llm.prompts import get_global_digest_prompt
+from ..llm.client import get_llm_client
+from ..llm.prompts import get_global_digest_prompt, GLOBAL_DIGEST_SYSTEM_PROMPT
 from ..aggregator.deduplicator import Deduplicator
 from ..utils.logger import get_logger
 from ..utils.timezone import get_time_period, now_in_timezone
 
-import json
+import re
+
+import orjson
 
 
 logger = get_logger("global_digest")
 
+# Markdown code fence some models wrap JSON responses in
+_FENCE_RE = re.compile(r"\A```(?:json)?\s*|\s*```\Z")
+
 
 @dataclass
 class GlobalEvent:
@@ -29,42 +35,68 @@ class GlobalEvent:
 class GlobalDigestGenerator:
     """Generates a global digest from all regional news."""
 
+    _REGION_NAMES = {
+        "usa": "USA",
+        "russia": "Russia",
+        "europe": "Europe",
+        "china": "China",
+        "japan": "Japan",
+        "india": "India",
+        "middle_east": "Middle East",
+        "latam": "Latin America"
+    }
+
+    _REGION_NAMES_RU = {
+        "usa": "США",
+        "russia": "Россия",
+        "europe": "Европа",
+        "china": "Китай",
+        "japan": "Япония",
+        "india": "Индия",
+        "middle_east": "Ближний Восток",
+        "latam": "Латинская Америка",
+        "global": "Глобально"
+    }
+
     def __init__(self, db: Optional[Database] = None):
         self.db = db or Database()
-        self.llm = LLMClient()
+        self.llm = get_llm_client()
         self.deduplicator = Deduplicator()
 
     async def generate(
         self,
-        all_articles: Dict[str, List[RawArticle]]
+        all_articles: Dict[str, List[RawArticle]],
+        deduplicated: bool = False
     ) -> Optional[ProcessedDigest]:
         """
         Generate a global digest from articles across all regions.
 
         Args:
             all_articles: Dict mapping region -> list of articles
+            deduplicated: True if the articles were already deduplicated
+                across regions, so the global pass can be skipped
 
         Returns:
             ProcessedDigest for the global summary
         """
-        total_articles = sum(len(arts) for arts in all_articles.values())
+        all_flat: List[RawArticle] = list(chain.from_iterable(all_articles.values()))
+        all_sources = {a.source_name for a in all_flat}
+
+        total_articles = len(all_flat)
         if total_articles == 0:
             logger.warning("No articles to process for global digest")
             return None
 
         logger.info(f"Generating global digest from {total_articles} articles across {len(all_articles)} regions")
 
-        # Flatten and deduplicate all articles
-        all_flat = []
-        for region, articles in all_articles.items():
-            for article in articles:
-                all_flat.append(article)
-
-        unique_articles = self.deduplicator.deduplicate(all_flat)
-        logger.info(f"After global deduplication: {len(unique_articles)} unique articles")
+        if deduplicated:
+            unique_articles = all_flat
+        else:
+            unique_articles = self.deduplicator.deduplicate(all_flat)
+            logger.info(f"After global deduplication: {len(unique_articles)} unique articles")
 
         # Prepare articles text for LLM (limit to top articles per region for efficiency)
-        articles_by_region = self._group_by_region(unique_articles)
+        articles_by_region = self.group_by_region(unique_articles)
         articles_text = self._format_articles_for_llm(articles_by_region)
 
         # Generate global summary via LLM
@@ -72,7 +104,7 @@ class GlobalDigestGenerator:
 
         try:
             messages = [
-                {"role": "system", "content": "You are a professional global news analyst. Always respond with valid JSON."},
+                {"role": "system", "content": GLOBAL_DIGEST_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ]
             response = await self.llm.complete(messages=messages, max_tokens=2000, json_mode=True)
@@ -84,11 +116,6 @@ class GlobalDigestGenerator:
         # Create digest
         time_period = get_time_period(now_in_timezone("Europe/Berlin").hour)
 
-        all_sources = set()
-        for articles in all_articles.values():
-            for a in articles:
-                all_sources.add(a.source_name)
-
         digest = ProcessedDigest(
             region="global",
             region_name_ru="Мировой дайджест",
@@ -105,7 +132,7 @@ class GlobalDigestGenerator:
 
         return digest
 
-    def _group_by_region(self, articles: List[RawArticle]) -> Dict[str, List[RawArticle]]:
+    def group_by_region(self, articles: List[RawArticle]) -> Dict[str, List[RawArticle]]:
         """Group articles by region."""
         grouped = {}
         for article in articles:
@@ -120,30 +147,19 @@ class GlobalDigestGenerator:
         max_per_region: int = 15
     ) -> str:
         """Format articles for LLM processing."""
+        region_names = self._REGION_NAMES
         parts = []
 
-        region_names = {
-            "usa": "USA",
-            "russia": "Russia",
-            "europe": "Europe",
-            "china": "China",
-            "japan": "Japan",
-            "india": "India",
-            "middle_east": "Middle East",
-            "latam": "Latin America"
-        }
-
         for region, articles in articles_by_region.items():
-            region_name = region_names.get(region, region.upper())
-            parts.append(f"\n=== {region_name} ===")
-
-            for article in articles[:max_per_region]:
-                title = article.title[:200] if article.title else ""
-                desc = article.description[:300] if article.description else ""
-                source = article.source_name or "Unknown"
-                parts.append(f"[{source}] {title}")
-                if desc:
-                    parts.append(f"   {desc}")
+            rows = [
+                LLMArticleRow.from_raw(a, desc_limit=300)
+                for a in articles[:max_per_region]
+            ]
+            parts.append(f"\n=== {region_names.get(region, region.upper())} ===")
+            parts.extend(
+                f"[{r.source}] {r.title}\n   {r.desc}" if r.desc else f"[{r.source}] {r.title}"
+                for r in rows
+            )
 
         return "\n".join(parts)
 
@@ -151,16 +167,9 @@ class GlobalDigestGenerator:
         """Parse LLM response for global digest."""
         try:
             # Try to extract JSON from response
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-
-            return json.loads(response.strip())
-        except json.JSONDecodeError:
+            response = _FENCE_RE.sub("", response.strip())
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse LLM response as JSON, using fallback")
             return {
                 "key_topics": ["World Events"],
@@ -176,33 +185,21 @@ class GlobalDigestGenerator:
 
     def _format_global_summary(self, summary: dict) -> str:
         """Format the global summary into readable text."""
-        parts = []
+        return "\n".join(
+            self._emit_event(i, event)
+            for i, event in enumerate(summary.get("events", []), 1)
+        )
 
-        region_names_ru = {
-            "usa": "США",
-            "russia": "Россия",
-            "europe": "Европа",
-            "china": "Китай",
-            "japan": "Япония",
-            "india": "Индия",
-            "middle_east": "Ближний Восток",
-            "latam": "Латинская Америка",
-            "global": "Глобально"
-        }
-
-        for i, event in enumerate(summary.get("events", []), 1):
-            headline = event.get("headline", "")
-            text = event.get("summary", "")
-            regions = event.get("regions", [])
-
-            # Translate region codes to Russian
-            regions_ru = [region_names_ru.get(r, r) for r in regions]
-            regions_str = ", ".join(regions_ru) if regions_ru else ""
-
-            parts.append(f"<b>{i}. {headline}</b>")
-            parts.append(text)
-            if regions_str:
-                parts.append(f"<i>Регионы: {regions_str}</i>")
-            parts.append("")
+    def _emit_event(self, index: int, event: dict) -> str:
+        """Format one global event, ending with a blank separator line."""
+        # Translate region codes to Russian
+        regions_ru = ", ".join(
+            self._REGION_NAMES_RU.get(r, r) for r in event.get("regions", [])
+        )
+        regions_line = f"<i>Регионы: {regions_ru}</i>\n" if regions_ru else ""
 
-        return "\n".join(parts)
+        return (
+            f"<b>{index}. {event.get('headline', '')}</b>\n"
+            f"{event.get('summary', '')}\n"
+            f"{regions_line}"
+        )
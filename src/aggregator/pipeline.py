@@ -1,10 +1,11 @@
 from typing import Optional, Dict, List, Tuple
 from datetime import datetime
+import asyncio
 
 from ..storage.database import Database
 from ..storage.models import ProcessedDigest, RawArticle
 from ..utils.logger import get_logger
-from ..utils.config import get_region_info
+from ..utils.config import get_config, get_region_info
 from ..utils.timezone import get_time_period, now_in_timezone
 
 from .collector import Collector
@@ -17,6 +18,16 @@ from .global_digest import GlobalDigestGenerator
 logger = get_logger("pipeline")
 
 
+def _extract_columns(articles: List[RawArticle]) -> Tuple[List[str], List[str]]:
+    """Collect article ids and distinct source names in a single pass."""
+    ids = []
+    sources = set()
+    for a in articles:
+        ids.append(a.id)
+        sources.add(a.source_name)
+    return ids, list(sources)
+
+
 class NewsPipeline:
     """Main pipeline for processing news from a region."""
 
@@ -28,6 +39,11 @@ class NewsPipeline:
         self.translator = Translator()
         self.global_generator = GlobalDigestGenerator(self.db)
 
+        pipeline_config = get_config().get("pipeline", {})
+        self._sem = asyncio.Semaphore(
+            pipeline_config.get("max_concurrent_regions", 4)
+        )
+
     async def process_region(self, region: str) -> Optional[ProcessedDigest]:
         """Process news for a single region through the full pipeline."""
         logger.info(f"Starting pipeline for {region}")
@@ -62,6 +78,7 @@ class NewsPipeline:
 
         region_time = now_in_timezone(timezone)
         time_period = get_time_period(region_time.hour)
+        ids, sources = _extract_columns(unique_articles)
 
         digest = ProcessedDigest(
             region=region,
@@ -69,27 +86,24 @@ class NewsPipeline:
             summary_ru=summary_text,
             key_topics=summary.get("key_topics", []),
             article_count=len(unique_articles),
-            sources_used=list(set(a.source_name for a in unique_articles)),
-            article_ids=[a.id for a in unique_articles],
+            sources_used=sources,
+            article_ids=ids,
             time_period=time_period,
         )
 
         self.db.save_digest(digest)
-        self.db.mark_articles_processed([a.id for a in unique_articles])
+        # Duplicates dropped above are covered by this digest too
+        self.db.mark_articles_processed([a.id for a in articles])
 
         logger.info(f"Pipeline completed for {region}")
         return digest
 
     def _format_summary_text(self, summary: dict) -> str:
         """Format summary dict into readable text."""
-        parts = []
-
-        for i, story in enumerate(summary.get("stories", []), 1):
-            headline = story.get("headline", "")
-            text = story.get("summary", "")
-            parts.append(f"<b>{i}. {headline}</b>\n{text}")
-
-        return "\n\n".join(parts)
+        return "\n\n".join(
+            f"<b>{i}. {story.get('headline', '')}</b>\n{story.get('summary', '')}"
+            for i, story in enumerate(summary.get("stories", []), 1)
+        )
 
     async def collect_region_articles(self, region: str) -> List[RawArticle]:
         """Collect articles for a region without generating digest."""
@@ -98,18 +112,16 @@ class NewsPipeline:
         return articles or []
 
     async def process_all_regions(self, regions: list) -> dict:
-        """Process all regions and return digests."""
-        results = {}
-
-        for region in regions:
-            try:
-                digest = await self.process_region(region)
-                results[region] = digest
-            except Exception as e:
-                logger.error(f"Error processing {region}: {e}")
-                results[region] = None
+        """Process all regions concurrently and return digests."""
+        async def _one(region: str) -> Tuple[str, Optional[ProcessedDigest]]:
+            async with self._sem:
+                try:
+                    return region, await self.process_region(region)
+                except Exception as e:
+                    logger.error(f"Error processing {region}: {e}")
+                    return region, None
 
-        return results
+        return dict(await asyncio.gather(*(_one(r) for r in regions)))
 
     async def process_all_with_global(
         self,
@@ -123,76 +135,127 @@ class NewsPipeline:
         """
         logger.info(f"Starting full pipeline with global digest for {len(regions)} regions")
 
-        # Step 1: Collect all articles from all regions
-        all_articles: Dict[str, List[RawArticle]] = {}
-        for region in regions:
-            try:
-                articles = await self.collect_region_articles(region)
-                all_articles[region] = articles
-                logger.info(f"Collected {len(articles)} articles from {region}")
-            except Exception as e:
-                logger.error(f"Error collecting from {region}: {e}")
-                all_articles[region] = []
+        # Step 1: Collect articles concurrently and deduplicate the batches in
+        # the configured region order, so which region keeps a shared story
+        # does not depend on which fetch finished first
+        queue: "asyncio.Queue[Tuple[str, List[RawArticle]]]" = asyncio.Queue()
+        # Every collected id per region, duplicates included, so the copies
+        # dropped by deduplication are marked processed along with the rest
+        collected_ids: Dict[str, List[str]] = {}
+
+        async def _collect(region: str) -> None:
+            async with self._sem:
+                try:
+                    articles = await self.collect_region_articles(region)
+                    logger.info(f"Collected {len(articles)} articles from {region}")
+                except Exception as e:
+                    logger.error(f"Error collecting from {region}: {e}")
+                    articles = []
+            collected_ids[region] = [a.id for a in articles]
+            await queue.put((region, articles))
+
+        async def _deduplicate() -> Tuple[int, List[RawArticle]]:
+            index = self.deduplicator.create_index()
+            total = 0
+            unique: List[RawArticle] = []
+            pending: Dict[str, List[RawArticle]] = {}
+            next_pos = 0
+            for _ in regions:
+                region, articles = await queue.get()
+                pending[region] = articles
+                # Index every batch whose predecessors have all arrived
+                while next_pos < len(regions) and regions[next_pos] in pending:
+                    batch = pending.pop(regions[next_pos])
+                    next_pos += 1
+                    total += len(batch)
+                    unique.extend(index.add(batch))
+            return total, unique
+
+        _, (total, unique_articles) = await asyncio.gather(
+            asyncio.gather(*(_collect(r) for r in regions)),
+            _deduplicate(),
+        )
 
-        total = sum(len(a) for a in all_articles.values())
         logger.info(f"Total articles collected: {total}")
+        logger.info(f"After global deduplication: {len(unique_articles)} unique articles")
+        by_region = self.global_generator.group_by_region(unique_articles)
 
-        # Step 2: Generate global digest FIRST
-        global_digest = None
-        try:
-            global_digest = await self.global_generator.generate(all_articles)
-            if global_digest:
-                logger.info("Global digest generated successfully")
-        except Exception as e:
-            logger.error(f"Error generating global digest: {e}")
-
-        # Step 3: Generate regional digests
-        regional_digests = {}
-        for region in regions:
+        # Steps 2 and 3: the global and regional digests are independent
+        # LLM work, so generate them concurrently
+        async def _global() -> Optional[ProcessedDigest]:
             try:
-                articles = all_articles.get(region, [])
-                if not articles:
-                    regional_digests[region] = None
-                    continue
-
-                # Deduplicate and summarize
-                unique_articles = self.deduplicator.deduplicate(articles)
-                if not unique_articles:
-                    regional_digests[region] = None
-                    continue
-
-                region_info = get_region_info(region)
-                primary_lang = region_info.get("primary_language", "en")
-                region_name_ru = region_info.get("name_ru", region)
-                timezone = region_info.get("timezone", "UTC")
-
-                summary = await self.summarizer.summarize(unique_articles, region)
-
-                if primary_lang != "ru":
-                    summary = await self.translator.translate_summary(summary, primary_lang)
-
-                summary_text = self._format_summary_text(summary)
-                region_time = now_in_timezone(timezone)
-                time_period = get_time_period(region_time.hour)
-
-                digest = ProcessedDigest(
-                    region=region,
-                    region_name_ru=region_name_ru,
-                    summary_ru=summary_text,
-                    key_topics=summary.get("key_topics", []),
-                    article_count=len(unique_articles),
-                    sources_used=list(set(a.source_name for a in unique_articles)),
-                    article_ids=[a.id for a in unique_articles],
-                    time_period=time_period,
+                digest = await self.global_generator.generate(
+                    by_region, deduplicated=True
                 )
-
-                self.db.save_digest(digest)
-                self.db.mark_articles_processed([a.id for a in unique_articles])
-                regional_digests[region] = digest
-                logger.info(f"Regional digest for {region} completed")
-
+                if digest:
+                    logger.info("Global digest generated successfully")
+                return digest
             except Exception as e:
-                logger.error(f"Error processing {region}: {e}")
-                regional_digests[region] = None
+                logger.error(f"Error generating global digest: {e}")
+                return None
+
+        async def _regional(region: str) -> Tuple[str, Optional[ProcessedDigest]]:
+            async with self._sem:
+                try:
+                    return region, await self._build_regional_digest(
+                        region, by_region.get(region, []), collected_ids[region]
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing {region}: {e}")
+                    return region, None
+
+        global_digest, regional_pairs = await asyncio.gather(
+            _global(),
+            asyncio.gather(*(_regional(r) for r in regions)),
+        )
+        regional_digests = dict(regional_pairs)
 
         return global_digest, regional_digests
+
+    async def _build_regional_digest(
+        self,
+        region: str,
+        unique_articles: List[RawArticle],
+        collected_ids: List[str]
+    ) -> Optional[ProcessedDigest]:
+        """Summarize and save the digest for one region's deduplicated articles.
+
+        All collected_ids are marked processed once the digest is saved,
+        including duplicates whose story another region kept.
+        """
+        if not unique_articles:
+            # Everything collected here duplicated other regions' articles
+            if collected_ids:
+                self.db.mark_articles_processed(collected_ids)
+            return None
+
+        region_info = get_region_info(region)
+        primary_lang = region_info.get("primary_language", "en")
+        region_name_ru = region_info.get("name_ru", region)
+        timezone = region_info.get("timezone", "UTC")
+
+        summary = await self.summarizer.summarize(unique_articles, region)
+
+        if primary_lang != "ru":
+            summary = await self.translator.translate_summary(summary, primary_lang)
+
+        summary_text = self._format_summary_text(summary)
+        region_time = now_in_timezone(timezone)
+        time_period = get_time_period(region_time.hour)
+        ids, sources = _extract_columns(unique_articles)
+
+        digest = ProcessedDigest(
+            region=region,
+            region_name_ru=region_name_ru,
+            summary_ru=summary_text,
+            key_topics=summary.get("key_topics", []),
+            article_count=len(unique_articles),
+            sources_used=sources,
+            article_ids=ids,
+            time_period=time_period,
+        )
+
+        self.db.save_digest(digest)
+        self.db.mark_articles_processed(collected_ids)
+        logger.info(f"Regional digest for {region} completed")
+        return digest
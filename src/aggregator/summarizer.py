@@ -1,6 +1,6 @@
 from typing import List, Dict
 
-from ..storage.models import RawArticle
+from ..storage.models import RawArticle, LLMArticleRow
 from ..llm.client import get_llm_client
 from ..utils.logger import get_logger
 from ..utils.config import get_region_info
@@ -43,25 +43,10 @@ class Summarizer:
 
     def _format_articles_for_llm(self, articles: List[RawArticle]) -> str:
         """Format articles as text for LLM input."""
-        parts = []
+        rows = [LLMArticleRow.from_raw(a, desc_limit=500) for a in articles[:30]]
 
-        for i, article in enumerate(articles[:30], 1):
-            source = article.source_name
-            title = article.title
-            desc = article.description[:500] if article.description else ""
-
-            date_str = ""
-            if article.published_at:
-                date_str = article.published_at.strftime("%Y-%m-%d %H:%M")
-
-            entry = f"""
----
-Article {i}
-Source: {source}
-Date: {date_str}
-Title: {title}
-Summary: {desc}
----"""
-            parts.append(entry)
-
-        return "\n".join(parts)
+        return "\n".join(
+            f"\n---\nArticle {i}\nSource: {r.source}\nDate: {r.date}"
+            f"\nTitle: {r.title}\nSummary: {r.desc}\n---"
+            for i, r in enumerate(rows, 1)
+        )
@@ -1,4 +1,5 @@
 from typing import Dict, List
+import asyncio
 
 from ..llm.client import get_llm_client
 from ..utils.logger import get_logger
@@ -11,8 +12,10 @@ logger = get_logger("translator")
 class Translator:
     """Translates summaries to Russian using LLM."""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 8):
         self.llm = get_llm_client()
+        # Bounds parallel per-text requests to respect provider rate limits
+        self._sem = asyncio.Semaphore(max_concurrency)
 
     async def translate_summary(
         self,
@@ -23,37 +26,50 @@ class Translator:
         if source_language == "ru":
             return summary
 
-        translated_stories = []
-        for story in summary.get("stories", []):
-            headline = await self.llm.translate(
-                text=story["headline"],
-                source_language=source_language,
-                target_language="ru"
-            )
-            story_summary = await self.llm.translate(
-                text=story["summary"],
-                source_language=source_language,
-                target_language="ru"
-            )
-            translated_stories.append({
-                "headline": headline.strip(),
-                "summary": story_summary.strip()
-            })
-
-        translated_topics = []
-        for topic in summary.get("key_topics", []):
-            translated = await self.llm.translate(
-                text=topic,
-                source_language=source_language,
-                target_language="ru"
-            )
-            translated_topics.append(translated.strip())
+        stories = summary.get("stories", [])
+        topics = summary.get("key_topics", [])
+        flat = (
+            [story["headline"] for story in stories]
+            + [story["summary"] for story in stories]
+            + list(topics)
+        )
+
+        if not flat:
+            return {"key_topics": [], "stories": []}
+
+        translated = await self.llm.translate_batch(
+            texts=flat,
+            source_language=source_language,
+            target_language="ru"
+        )
+
+        if translated is None:
+            logger.info("Falling back to per-text translation")
+            translated = await asyncio.gather(*(
+                self._translate_one(text, source_language) for text in flat
+            ))
+
+        translated = [t.strip() for t in translated]
+        n = len(stories)
+        headlines, summaries = translated[:n], translated[n:2 * n]
 
         return {
-            "key_topics": translated_topics,
-            "stories": translated_stories
+            "key_topics": translated[2 * n:],
+            "stories": [
+                {"headline": headline, "summary": story_summary}
+                for headline, story_summary in zip(headlines, summaries)
+            ]
         }
 
+    async def _translate_one(self, text: str, source_language: str) -> str:
+        """Translate a single text to Russian under the concurrency limit."""
+        async with self._sem:
+            return await self.llm.translate(
+                text=text,
+                source_language=source_language,
+                target_language="ru"
+            )
+
     async def translate_to_russian(
         self,
         text: str,
@@ -1,14 +1,24 @@
 from .client import LLMClient, get_llm_client
 from .prompts import (
+    SUMMARIZATION_SYSTEM_PROMPT,
+    TRANSLATION_SYSTEM_PROMPT,
+    BATCH_TRANSLATION_SYSTEM_PROMPT,
+    GLOBAL_DIGEST_SYSTEM_PROMPT,
     get_summarization_prompt,
     get_translation_prompt,
+    get_batch_translation_prompt,
     get_digest_formatting_prompt,
 )
 
 __all__ = [
     "LLMClient",
     "get_llm_client",
+    "SUMMARIZATION_SYSTEM_PROMPT",
+    "TRANSLATION_SYSTEM_PROMPT",
+    "BATCH_TRANSLATION_SYSTEM_PROMPT",
+    "GLOBAL_DIGEST_SYSTEM_PROMPT",
     "get_summarization_prompt",
     "get_translation_prompt",
+    "get_batch_translation_prompt",
     "get_digest_formatting_prompt",
 ]
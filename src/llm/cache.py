@@ -0,0 +1,155 @@
+"""Response cache for LLM completions."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import aiosqlite
+
+from ..utils.logger import get_logger
+
+
+logger = get_logger("llm_cache")
+
+
+class ResponseCache:
+    """In-memory TTL cache for completions keyed by the request parameters."""
+
+    def __init__(self, ttl: float = 3600, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is turned on."""
+        return self.ttl > 0 and self.max_entries > 0
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Build a stable cache key from completion request kwargs."""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entries."""
+        if not self.enabled:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+class DiskResponseCache:
+    """SQLite-backed TTL cache that keeps completions across runs.
+
+    Keys are content hashes of the full request, so retries and overlapping
+    time windows that rebuild the same prompt skip the LLM call entirely.
+    Storage errors are logged and treated as misses; they never fail a call.
+    """
+
+    def __init__(self, path: str = "data/llm_cache.db", ttl: float = 21600):
+        self.path = path
+        self.ttl = ttl
+        self._initialized = False
+
+        if self.enabled:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Disabling LLM disk cache at {path}: {e}")
+                self.path = ""
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is turned on."""
+        return bool(self.path) and self.ttl > 0
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Build a sha256 content hash from completion request kwargs."""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _ensure_schema(self, db: aiosqlite.Connection) -> None:
+        """Create the table and drop expired rows on first use."""
+        if self._initialized:
+            return
+
+        await db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        await db.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        await db.commit()
+        self._initialized = True
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return a cached response or None if missing, expired or unreadable."""
+        if not self.enabled:
+            return None
+
+        try:
+            async with aiosqlite.connect(self.path, timeout=5) as db:
+                await self._ensure_schema(db)
+                async with db.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at >= ?",
+                    (key, time.time())
+                ) as cursor:
+                    row = await cursor.fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"LLM disk cache read failed: {e}")
+            return None
+
+        return row[0] if row else None
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response until its TTL expires; failures are only logged."""
+        if not self.enabled:
+            return
+
+        try:
+            async with aiosqlite.connect(self.path, timeout=5) as db:
+                await self._ensure_schema(db)
+                await db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, time.time() + self.ttl)
+                )
+                await db.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"LLM disk cache write failed: {e}")
+
+    async def clear(self) -> None:
+        """Drop all cached responses."""
+        if not Path(self.path).exists():
+            return
+
+        async with aiosqlite.connect(self.path) as db:
+            await self._ensure_schema(db)
+            await db.execute("DELETE FROM responses")
+            await db.commit()
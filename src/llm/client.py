@@ -1,15 +1,69 @@
-from typing import List, Dict, Optional
-import json
+from typing import Callable, List, Dict, Optional
 
+import httpx
+import openai
+import orjson
 from openai import AsyncOpenAI
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from ..utils.logger import get_logger
 from ..utils.config import get_settings, get_config
+from .cache import DiskResponseCache, ResponseCache
+from .prompts import (
+    SUMMARIZATION_SYSTEM_PROMPT,
+    TRANSLATION_SYSTEM_PROMPT,
+    BATCH_TRANSLATION_SYSTEM_PROMPT,
+)
 
 
 logger = get_logger("llm_client")
 
 
+# Worth retrying on the same model after a short backoff
+TRANSIENT_ERRORS = (
+    httpx.TimeoutException,
+    openai.RateLimitError,
+    openai.APIConnectionError,
+)
+
+# Worth switching to the fallback model once retries are exhausted
+FALLBACK_ERRORS = TRANSIENT_ERRORS + (
+    openai.BadRequestError,
+    openai.NotFoundError,
+    openai.InternalServerError,
+)
+
+
+def _is_json_object(content: str) -> bool:
+    """Whether a response parses as a JSON object."""
+    try:
+        return isinstance(orjson.loads(content), dict)
+    except orjson.JSONDecodeError:
+        return False
+
+
+def _parse_translations(response: str, count: int) -> Optional[List[str]]:
+    """Extract exactly count translations from a batch response."""
+    # complete() returns None for empty or filtered replies
+    if not isinstance(response, str):
+        return None
+
+    try:
+        translations = orjson.loads(response).get("translations")
+    except (orjson.JSONDecodeError, AttributeError):
+        return None
+
+    if not isinstance(translations, list) or len(translations) != count:
+        return None
+
+    return [str(t) for t in translations]
+
+
 class LLMClient:
     """Client for OpenRouter API (OpenAI-compatible)."""
 
@@ -20,11 +74,28 @@ class LLMClient:
         self.client = AsyncOpenAI(
             base_url=config["llm"]["base_url"],
             api_key=settings.openrouter_api_key,
+            max_retries=0,  # retries are handled by _create
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=100,
+                ),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            ),
         )
 
         self.default_model = config["llm"]["default_model"]
         self.fallback_model = config["llm"]["fallback_model"]
         self.temperature = config["llm"]["temperature"]
+        self.max_tokens_summary = config["llm"]["max_tokens_summary"]
+        self.max_tokens_translation = config["llm"]["max_tokens_translation"]
+        self.prompt_caching = config["llm"].get("prompt_caching", False)
+        self.cache = ResponseCache(ttl=config["llm"].get("cache_ttl", 3600))
+        self.disk_cache = DiskResponseCache(
+            path=config["llm"].get("disk_cache_path", ""),
+            ttl=config["llm"].get("disk_cache_ttl", 21600)
+        )
 
     async def complete(
         self,
@@ -32,16 +103,25 @@ class LLMClient:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: int = 4096,
-        json_mode: bool = False
+        json_mode: bool = False,
+        validate: Optional[Callable[[str], bool]] = None
     ) -> str:
-        """Send a completion request to the LLM."""
+        """Send a completion request to the LLM.
+
+        Responses are cached only if validate accepts them; in JSON mode
+        it defaults to checking for a JSON object, so malformed replies are
+        never replayed on retry.
+        """
+        if validate is None and json_mode:
+            validate = _is_json_object
+
         model = model or self.default_model
         temperature = temperature if temperature is not None else self.temperature
 
         try:
             kwargs = {
                 "model": model,
-                "messages": messages,
+                "messages": self._with_cache_control(messages),
                 "temperature": temperature,
                 "max_tokens": max_tokens,
             }
@@ -49,10 +129,28 @@ class LLMClient:
             if json_mode:
                 kwargs["response_format"] = {"type": "json_object"}
 
-            response = await self.client.chat.completions.create(**kwargs)
-            return response.choices[0].message.content
+            cache_key = self.cache.make_key(kwargs)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {model}")
+                return cached
+
+            disk_key = self.disk_cache.make_key(kwargs)
+            cached = await self.disk_cache.get(disk_key)
+            if cached is not None:
+                logger.debug(f"LLM disk cache hit for {model}")
+                self.cache.set(cache_key, cached)
+                return cached
 
-        except Exception as e:
+            response = await self._create(**kwargs)
+            content = response.choices[0].message.content
+
+            if content and (validate is None or validate(content)):
+                self.cache.set(cache_key, content)
+                await self.disk_cache.set(disk_key, content)
+            return content
+
+        except FALLBACK_ERRORS as e:
             logger.error(f"LLM error with {model}: {e}")
 
             if model != self.fallback_model:
@@ -62,10 +160,51 @@ class LLMClient:
                     model=self.fallback_model,
                     temperature=temperature,
                     max_tokens=max_tokens,
-                    json_mode=json_mode
+                    json_mode=json_mode,
+                    validate=validate
                 )
             raise
 
+    @retry(
+        retry=retry_if_exception_type(TRANSIENT_ERRORS),
+        wait=wait_exponential_jitter(initial=1, max=10),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def _create(self, **kwargs):
+        """Call the completions API, backing off on transient errors."""
+        return await self.client.chat.completions.create(**kwargs)
+
+    def _with_cache_control(
+        self,
+        messages: List[Dict[str, str]]
+    ) -> List[Dict]:
+        """Mark system messages as a cacheable prompt prefix.
+
+        OpenRouter forwards cache_control breakpoints to providers that need
+        explicit hints (Anthropic); providers with automatic prefix caching
+        ignore them. Anthropic only caches prefixes of at least 1024 tokens,
+        which the current system prompts are well short of, so this stays a
+        no-op until a prompt grows past that. Toggling it changes the request
+        payload and with it every response cache key.
+        """
+        if not self.prompt_caching:
+            return messages
+
+        return [
+            {
+                "role": "system",
+                "content": [{
+                    "type": "text",
+                    "text": m["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }],
+            }
+            if m["role"] == "system" and isinstance(m["content"], str)
+            else m
+            for m in messages
+        ]
+
     async def summarize(
         self,
         articles_text: str,
@@ -84,20 +223,19 @@ class LLMClient:
         )
 
         messages = [
-            {"role": "system", "content": "You are a professional news analyst. Always respond with valid JSON."},
+            {"role": "system", "content": SUMMARIZATION_SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
 
-        config = get_config()
         response = await self.complete(
             messages=messages,
-            max_tokens=config["llm"]["max_tokens_summary"],
+            max_tokens=self.max_tokens_summary,
             json_mode=True
         )
 
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
             logger.error(f"Failed to parse JSON response: {response[:200]}")
             return {
                 "key_topics": [],
@@ -120,16 +258,52 @@ class LLMClient:
         )
 
         messages = [
-            {"role": "system", "content": "You are a professional translator. Translate accurately while maintaining natural language flow."},
+            {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
 
-        config = get_config()
         return await self.complete(
             messages=messages,
-            max_tokens=config["llm"]["max_tokens_translation"]
+            max_tokens=self.max_tokens_translation
+        )
+
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str = "ru"
+    ) -> Optional[List[str]]:
+        """Translate several texts in a single request.
+
+        Returns None if the response is not a JSON list of the same length,
+        so callers can fall back to translating texts one by one.
+        """
+        from .prompts import get_batch_translation_prompt
+
+        prompt = get_batch_translation_prompt(
+            texts_json=orjson.dumps(texts).decode("utf-8"),
+            source_language=source_language,
+            target_language=target_language
+        )
+
+        messages = [
+            {"role": "system", "content": BATCH_TRANSLATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+        response = await self.complete(
+            messages=messages,
+            max_tokens=self.max_tokens_translation,
+            json_mode=True,
+            validate=lambda r: _parse_translations(r, len(texts)) is not None
         )
 
+        translations = _parse_translations(response, len(texts))
+        if translations is None:
+            logger.warning(f"Invalid batch translation response: {(response or '')[:200]}")
+
+        return translations
+
 
 _client: Optional[LLMClient] = None
 
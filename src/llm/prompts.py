@@ -15,19 +15,21 @@ LANGUAGE_NAMES = {
 }
 
 
-def get_summarization_prompt(
-    articles_text: str,
-    region_name: str,
-    language: str = "en",
-    max_words: int = 500
-) -> str:
-    """Generate prompt for news summarization."""
-    output_lang = LANGUAGE_NAMES.get(language, "English")
+class _LangMap(dict):
+    """Language name lookup that falls back to the code itself."""
 
-    return f"""Analyze the following news articles from {region_name} and create a structured summary.
+    def __missing__(self, key: str) -> str:
+        return key
+
+
+_LANGS = _LangMap(LANGUAGE_NAMES)
 
-ARTICLES:
-{articles_text}
+
+# System prompts hold all static instructions so that every call shares an
+# identical prefix that providers can cache; user prompts carry only data.
+SUMMARIZATION_SYSTEM_PROMPT = """You are a professional news analyst. Always respond with valid JSON.
+
+You will receive news articles from one region and must create a structured summary.
 
 INSTRUCTIONS:
 1. Identify the 3-5 most important and significant news stories
@@ -37,43 +39,29 @@ INSTRUCTIONS:
 3. Extract 3-5 key topics/themes covered across all articles
 4. Be objective and factual - present information without bias
 5. Focus on events with real impact or significance
-6. Total summary should be under {max_words} words
+6. Respect the word limit and output language given in the request
 
 OUTPUT FORMAT (respond with valid JSON only):
-{{
+{
   "key_topics": ["Topic 1", "Topic 2", "Topic 3"],
   "stories": [
-    {{
+    {
       "headline": "Clear headline describing the event",
       "summary": "2-3 sentence summary with key facts and context."
-    }},
-    {{
+    },
+    {
       "headline": "Second important story",
       "summary": "Summary of the second story."
-    }}
+    }
   ]
-}}
-
-Write all content in {output_lang}."""
+}"""
 
 
-def get_translation_prompt(
-    text: str,
-    source_language: str,
-    target_language: str = "ru"
-) -> str:
-    """Generate prompt for translation."""
-    source_name = LANGUAGE_NAMES.get(source_language, source_language)
-    target_name = LANGUAGE_NAMES.get(target_language, target_language)
-
-    return f"""Translate the following text from {source_name} to {target_name}.
-
-TEXT TO TRANSLATE:
-{text}
+TRANSLATION_SYSTEM_PROMPT = """You are a professional translator. Translate accurately while maintaining natural language flow.
 
 REQUIREMENTS:
 1. Preserve the exact meaning and tone of the original
-2. Use natural, fluent {target_name} language
+2. Use natural, fluent language in the target language
 3. Keep proper nouns (names, organizations, places) recognizable
 4. Maintain formatting (numbered lists, paragraphs, etc.)
 5. Do not add explanations or commentary
@@ -81,36 +69,28 @@ REQUIREMENTS:
 OUTPUT: Only the translated text, nothing else."""
 
 
-def get_digest_formatting_prompt(
-    summaries: dict,
-    region_name_ru: str
-) -> str:
-    """Generate prompt for final digest formatting."""
-    return f"""Format the following news summary for {region_name_ru} into a clean, readable digest.
-
-SUMMARY DATA:
-{summaries}
+BATCH_TRANSLATION_SYSTEM_PROMPT = """You are a professional translator. Always respond with valid JSON.
 
-FORMAT REQUIREMENTS:
-1. Start with key topics as bullet points
-2. Present each story with a bold headline followed by its summary
-3. Use clear paragraph separation
-4. Keep the language concise and informative
-5. Output should be ready to send as a Telegram message
+You will receive a JSON array of strings to translate.
 
-OUTPUT: Formatted text in Russian, ready for Telegram (HTML formatting allowed: <b>, <i>, etc.)"""
+REQUIREMENTS:
+1. Preserve the exact meaning and tone of each original string
+2. Use natural, fluent language in the target language
+3. Keep proper nouns (names, organizations, places) recognizable
+4. Translate every string separately - do not merge, split or reorder them
+5. Do not add explanations or commentary
 
+OUTPUT FORMAT (respond with valid JSON only):
+{
+  "translations": ["first translated string", "second translated string"]
+}
 
-def get_global_digest_prompt(articles_text: str, regions: list) -> str:
-    """Generate prompt for global news digest."""
-    regions_str = ", ".join(regions)
+The "translations" array must have exactly the same length and order as the input array."""
 
-    return f"""Analyze news from around the world and identify the 5-7 MOST IMPORTANT global events.
 
-REGIONS COVERED: {regions_str}
+GLOBAL_DIGEST_SYSTEM_PROMPT = """You are a professional global news analyst. Always respond with valid JSON.
 
-NEWS ARTICLES:
-{articles_text}
+You will receive news from around the world and must identify the 5-7 MOST IMPORTANT global events.
 
 IMPORTANCE CRITERIA (prioritize in this order):
 1. Geopolitical impact - events affecting international relations
@@ -127,22 +107,127 @@ CRITICAL RULES:
 - Write summaries in Russian
 
 OUTPUT FORMAT (respond with valid JSON only):
-{{
+{
   "key_topics": ["Геополитика", "Экономика", "Тема 3"],
   "events": [
-    {{
+    {
       "headline": "Заголовок на русском языке",
       "summary": "Краткое описание события в 2-3 предложениях с ключевыми фактами.",
       "regions": ["usa", "europe", "china"],
       "importance": "high"
-    }},
-    {{
+    },
+    {
       "headline": "Второе важное событие",
       "summary": "Описание второго события.",
       "regions": ["middle_east"],
       "importance": "high"
-    }}
+    }
   ]
-}}
+}
 
 IMPORTANT: All text must be in Russian. Respond ONLY with valid JSON."""
+
+
+# User prompt skeletons. The variable payload (articles, text) is appended
+# after the template rather than formatted into it, so the template text
+# always comes first and braces in the payload are never interpreted.
+_SUMMARIZATION_TEMPLATE = """Analyze the following news articles from {region_name} and create a structured summary.
+Total summary should be under {max_words} words.
+Write all content in {output_lang}.
+
+ARTICLES:
+"""
+
+_TRANSLATION_TEMPLATE = """Translate the following text from {source_name} to {target_name}.
+
+TEXT TO TRANSLATE:
+"""
+
+_BATCH_TRANSLATION_TEMPLATE = """Translate each string in the following JSON array from {source_name} to {target_name}.
+
+TEXTS TO TRANSLATE (JSON array):
+"""
+
+_DIGEST_FORMATTING_TEMPLATE = """Format the following news summary for {region_name_ru} into a clean, readable digest.
+
+FORMAT REQUIREMENTS:
+1. Start with key topics as bullet points
+2. Present each story with a bold headline followed by its summary
+3. Use clear paragraph separation
+4. Keep the language concise and informative
+5. Output should be ready to send as a Telegram message
+
+OUTPUT: Formatted text in Russian, ready for Telegram (HTML formatting allowed: <b>, <i>, etc.)
+
+SUMMARY DATA:
+"""
+
+_GLOBAL_DIGEST_TEMPLATE = """Identify the most important global events in the following news.
+
+REGIONS COVERED: {regions_str}
+
+NEWS ARTICLES:
+"""
+
+
+def get_summarization_prompt(
+    articles_text: str,
+    region_name: str,
+    language: str = "en",
+    max_words: int = 500
+) -> str:
+    """Generate prompt for news summarization."""
+    output_lang = LANGUAGE_NAMES.get(language, "English")
+
+    return _SUMMARIZATION_TEMPLATE.format(
+        region_name=region_name,
+        max_words=max_words,
+        output_lang=output_lang,
+    ) + articles_text
+
+
+def get_translation_prompt(
+    text: str,
+    source_language: str,
+    target_language: str = "ru"
+) -> str:
+    """Generate prompt for translation."""
+    source_name = _LANGS[source_language]
+    target_name = _LANGS[target_language]
+
+    return _TRANSLATION_TEMPLATE.format(
+        source_name=source_name,
+        target_name=target_name,
+    ) + text
+
+
+def get_batch_translation_prompt(
+    texts_json: str,
+    source_language: str,
+    target_language: str = "ru"
+) -> str:
+    """Generate prompt for translating a JSON array of strings in one call."""
+    source_name = _LANGS[source_language]
+    target_name = _LANGS[target_language]
+
+    return _BATCH_TRANSLATION_TEMPLATE.format(
+        source_name=source_name,
+        target_name=target_name,
+    ) + texts_json
+
+
+def get_digest_formatting_prompt(
+    summaries: dict,
+    region_name_ru: str
+) -> str:
+    """Generate prompt for final digest formatting."""
+    return _DIGEST_FORMATTING_TEMPLATE.format(
+        region_name_ru=region_name_ru
+    ) + str(summaries)
+
+
+def get_global_digest_prompt(articles_text: str, regions: list) -> str:
+    """Generate prompt for global news digest."""
+    regions_str = ", ".join(regions)
+
+    return _GLOBAL_DIGEST_TEMPLATE.format(regions_str=regions_str) + articles_text
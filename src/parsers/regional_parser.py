@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import asyncio
 
 from .base_parser import BaseParser
@@ -34,6 +34,10 @@ class RegionalParser(BaseParser):
         # TODO: Implement NewsAPI integration
         return []
 
+    async def aclose(self) -> None:
+        """Release network resources held by the parser."""
+        await self.rss_parser.aclose()
+
 
 def create_parser(region: str) -> RegionalParser:
     """Factory function to create a parser for a region."""
@@ -43,15 +47,25 @@ def create_parser(region: str) -> RegionalParser:
 async def fetch_region(region: str) -> List[RawArticle]:
     """Convenience function to fetch all articles for a region."""
     parser = create_parser(region)
-    return await parser.fetch()
+    try:
+        return await parser.fetch()
+    finally:
+        await parser.aclose()
 
 
 async def fetch_all_regions(regions: List[str]) -> Dict[str, List[RawArticle]]:
     """Fetch articles from all specified regions concurrently."""
-    tasks = {region: fetch_region(region) for region in regions}
-    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    async def _fetch(region: str) -> Tuple[str, List[RawArticle]]:
+        try:
+            return region, await fetch_region(region)
+        except Exception:
+            return region, []
+
+    # as_completed yields wrappers rather than the original tasks, so each
+    # result carries its own region
+    results: Dict[str, List[RawArticle]] = {}
+    for next_done in asyncio.as_completed([_fetch(r) for r in regions]):
+        region, articles = await next_done
+        results[region] = articles
 
-    return {
-        region: result if not isinstance(result, Exception) else []
-        for region, result in zip(tasks.keys(), results)
-    }
+    return {region: results[region] for region in regions}
@@ -1,5 +1,9 @@
 import asyncio
+import re
+import weakref
 from datetime import datetime
+from html import unescape
+from itertools import islice
 from typing import List, Dict, Any, Optional
 from email.utils import parsedate_to_datetime
 
@@ -12,23 +16,64 @@ from ..utils.logger import get_logger
 
 logger = get_logger("rss_parser")
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Feed downloads in flight at once across all parsers (and so all regions)
+MAX_CONCURRENT_FETCHES = 16
+
+# One semaphore per event loop, since asyncio primitives are loop-bound
+_fetch_semaphores = weakref.WeakKeyDictionary()
+
+
+def _shared_fetch_semaphore() -> asyncio.Semaphore:
+    """Get the fetch limit shared by every parser on the running loop."""
+    loop = asyncio.get_running_loop()
+    sem = _fetch_semaphores.get(loop)
+    if sem is None:
+        sem = _fetch_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    return sem
+
 
 class RSSParser:
     """Parser for RSS/Atom feeds."""
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        fetch_semaphore: Optional[asyncio.Semaphore] = None
+    ):
         self.timeout = timeout
         self.headers = {
             "User-Agent": "NewsAggregator/1.0 (https://github.com/news-aggregator)"
         }
+        # One pooled client for all feeds, so connections and TLS sessions
+        # are reused instead of rebuilt for every feed URL
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            headers=self.headers,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        # Caps simultaneous downloads; defaults to the process-wide limit so
+        # concurrent regions share it rather than each getting their own
+        self._sem = fetch_semaphore
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
 
     async def fetch_feed(self, url: str) -> Optional[feedparser.FeedParserDict]:
         """Fetch and parse an RSS feed."""
+        sem = self._sem or _shared_fetch_semaphore()
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
+            # Parsing happens outside the limit so a downloaded feed frees
+            # its slot for the next download
+            async with sem:
+                response = await self._client.get(url)
                 response.raise_for_status()
-                return feedparser.parse(response.text)
+            return await asyncio.to_thread(feedparser.parse, response.text)
         except httpx.TimeoutException:
             logger.warning(f"Timeout fetching feed: {url}")
         except httpx.HTTPStatusError as e:
@@ -53,13 +98,9 @@ class RSSParser:
             if not title or not link:
                 return None
 
-            description = ""
-            if "summary" in entry:
-                description = entry["summary"]
-            elif "description" in entry:
-                description = entry["description"]
-
-            description = self._clean_html(description)
+            description = self._clean_html(
+                entry.get("summary") or entry.get("description") or ""
+            )[:1000]
 
             content = None
             if "content" in entry and entry["content"]:
@@ -68,23 +109,23 @@ class RSSParser:
 
             published_at = self._parse_date(entry)
 
-            categories = []
             if "tags" in entry:
-                categories = [tag.get("term", "") for tag in entry.get("tags", [])]
-            elif "category" in entry:
-                categories = [entry["category"]]
+                terms = (tag.get("term") for tag in entry.get("tags") or ())
+            else:
+                terms = iter((entry.get("category"),))
+            categories = list(islice((t for t in terms if t), 5))
 
             return RawArticle(
                 region=region,
                 source_name=source_name,
                 source_url=source_url,
                 title=title,
-                description=description[:1000] if description else "",
+                description=description,
                 content=content,
                 url=link,
                 published_at=published_at,
                 language=language,
-                categories=[c for c in categories if c][:5],
+                categories=categories,
             )
         except Exception as e:
             logger.error(f"Error parsing entry: {e}")
@@ -96,12 +137,15 @@ class RSSParser:
 
         for field in date_fields:
             if field in entry:
-                try:
-                    parsed = entry.get(f"{field}_parsed")
-                    if parsed:
+                # feedparser normalizes *_parsed to UTC; a zero year, month
+                # or day marks a date it could not make sense of
+                parsed = entry.get(f"{field}_parsed")
+                if parsed and parsed[0] and parsed[1] and parsed[2]:
+                    try:
                         return datetime(*parsed[:6])
-                except Exception:
-                    pass
+                    except ValueError:
+                        # Leap seconds or impossible days such as 31 June
+                        pass
 
                 try:
                     return parsedate_to_datetime(entry[field])
@@ -115,15 +159,8 @@ class RSSParser:
         if not text:
             return ""
 
-        import re
-        text = re.sub(r"<[^>]+>", " ", text)
-        text = re.sub(r"\s+", " ", text)
-        text = text.replace("&nbsp;", " ")
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&quot;", '"')
-        return text.strip()
+        # Strip tags before decoding so escaped "<" and ">" in text survive
+        return _WS_RE.sub(" ", unescape(_TAG_RE.sub(" ", text))).strip()
 
     async def fetch_source(
         self,
@@ -143,17 +180,14 @@ class RSSParser:
             logger.warning(f"No entries from {name}")
             return []
 
-        articles = []
-        for entry in feed.entries:
-            article = self.parse_entry(
-                entry=entry,
-                source_name=name,
-                source_url=url,
-                region=region,
-                language=language
+        articles = [
+            article
+            for article in (
+                self.parse_entry(entry, name, url, region, language)
+                for entry in feed.entries
             )
-            if article:
-                articles.append(article)
+            if article is not None
+        ]
 
         logger.info(f"Parsed {len(articles)} articles from {name}")
         return articles
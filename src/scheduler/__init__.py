@@ -1,6 +1,5 @@
-from .cron_manager import NewsScheduler, run_scheduled_task
+from .cron_manager import NewsScheduler
 
 __all__ = [
     "NewsScheduler",
-    "run_scheduled_task",
 ]
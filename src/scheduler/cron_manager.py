@@ -1,4 +1,3 @@
-import asyncio
 from typing import List, Callable, Optional
 from datetime import datetime
 
@@ -18,7 +17,11 @@ class NewsScheduler:
     def __init__(self):
         settings = get_settings()
         self.user_timezone = settings.user_timezone
-        self.scheduler = AsyncIOScheduler(timezone=self.user_timezone)
+        self.scheduler = AsyncIOScheduler(
+            timezone=self.user_timezone,
+            # Still run a job that fires up to 5 minutes late (default is 1s)
+            job_defaults={"misfire_grace_time": 300}
+        )
         self.config = get_config()
 
     def add_daily_job(
@@ -82,14 +85,3 @@ class NewsScheduler:
         if job:
             job.modify(next_run_time=datetime.now())
             logger.info(f"Triggered job: {job_id}")
-
-
-async def run_scheduled_task(func: Callable, *args, **kwargs):
-    """Wrapper to run async functions as scheduled tasks."""
-    try:
-        if asyncio.iscoroutinefunction(func):
-            await func(*args, **kwargs)
-        else:
-            func(*args, **kwargs)
-    except Exception as e:
-        logger.error(f"Error in scheduled task: {e}")
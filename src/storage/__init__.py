@@ -1,10 +1,11 @@
 from .database import Database
-from .models import RawArticle, ProcessedDigest, RawArticleModel, DigestModel
+from .models import RawArticle, ProcessedDigest, LLMArticleRow, RawArticleModel, DigestModel
 
 __all__ = [
     "Database",
     "RawArticle",
     "ProcessedDigest",
+    "LLMArticleRow",
     "RawArticleModel",
     "DigestModel",
 ]
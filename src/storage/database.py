@@ -1,11 +1,40 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
-from sqlalchemy import create_engine, and_
+from sqlalchemy import create_engine, event, false, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, Session
 
-from .models import Base, RawArticleModel, DigestModel, RawArticle, ProcessedDigest
+from .models import (
+    Base, RawArticleModel, DigestModel, RawArticle, ProcessedDigest,
+    RAW_ARTICLE_COLUMNS, _now_utc,
+)
+
+
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    """Configure each new SQLite connection for fewer fsyncs and more caching."""
+    cursor = dbapi_conn.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+# URLs a Database instance remembers having saved or seen before the set
+# is dropped; the database lookup in save_articles stays authoritative
+KNOWN_URL_LIMIT = 50_000
+
+# URLs per IN (...) lookup, well under SQLite's bound-parameter limit
+URL_LOOKUP_CHUNK = 500
 
 
 class Database:
@@ -14,8 +43,19 @@ class Database:
     def __init__(self, db_path: str = "data/news.db"):
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
+        # create_all skips indexes of tables that already exist
+        for index in RawArticleModel.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        self._known_urls: Set[str] = set()
+
+    def _remember_urls(self, urls: Set[str]) -> None:
+        """Record URLs already in the database, bounded by KNOWN_URL_LIMIT."""
+        if len(self._known_urls) + len(urls) > KNOWN_URL_LIMIT:
+            self._known_urls.clear()
+        self._known_urls.update(urls)
 
     def get_session(self) -> Session:
         """Get a new database session."""
@@ -23,6 +63,9 @@ class Database:
 
     def save_article(self, article: RawArticle) -> bool:
         """Save a raw article to database. Returns False if duplicate."""
+        if article.url in self._known_urls:
+            return False
+
         with self.get_session() as session:
             existing = session.query(RawArticleModel).filter(
                 RawArticleModel.url == article.url
@@ -33,23 +76,48 @@ class Database:
 
             session.add(article.to_model())
             session.commit()
-            return True
+        self._remember_urls({article.url})
+        return True
 
     def save_articles(self, articles: List[RawArticle]) -> int:
         """Save multiple articles. Returns count of new articles saved."""
-        saved = 0
-        with self.get_session() as session:
-            for article in articles:
-                existing = session.query(RawArticleModel).filter(
-                    RawArticleModel.url == article.url
-                ).first()
+        if not articles:
+            return 0
 
-                if not existing:
-                    session.add(article.to_model())
-                    saved += 1
+        # Syndicated stories show up in several regions; URLs this instance
+        # has already saved or seen are rejected without a database round trip
+        known_urls = self._known_urls
+        candidates = [a for a in articles if a.url not in known_urls]
+        if not candidates:
+            return 0
 
-            session.commit()
-        return saved
+        with self.get_session() as session:
+            urls = list({a.url for a in candidates})
+            seen = set()
+            for i in range(0, len(urls), URL_LOOKUP_CHUNK):
+                stmt = select(RawArticleModel.url).where(
+                    RawArticleModel.url.in_(urls[i:i + URL_LOOKUP_CHUNK])
+                )
+                seen.update(session.execute(stmt).scalars())
+
+            new_articles = []
+            for article in candidates:
+                # Also skip repeats of the same URL within this batch
+                if article.url not in seen:
+                    seen.add(article.url)
+                    new_articles.append(article)
+
+            if new_articles:
+                # Core executemany instead of per-object ORM flushes; the
+                # conflict clause covers rows inserted since the check above
+                stmt = sqlite_insert(RawArticleModel).on_conflict_do_nothing(
+                    index_elements=["url"]
+                )
+                session.execute(stmt, RawArticle.to_values(new_articles))
+                session.commit()
+
+        self._remember_urls(seen)
+        return len(new_articles)
 
     def get_articles_for_region(
         self,
@@ -58,23 +126,24 @@ class Database:
         unprocessed_only: bool = True
     ) -> List[RawArticle]:
         """Get articles for a region within time window."""
-        since = datetime.utcnow() - timedelta(hours=hours_back)
+        since = _now_utc() - timedelta(hours=hours_back)
 
-        with self.get_session() as session:
-            query = session.query(RawArticleModel).filter(
-                and_(
-                    RawArticleModel.region == region,
-                    RawArticleModel.fetched_at >= since
-                )
-            )
+        stmt = select(*RAW_ARTICLE_COLUMNS).where(
+            RawArticleModel.region == region,
+            RawArticleModel.fetched_at >= since
+        )
 
-            if unprocessed_only:
-                query = query.filter(RawArticleModel.processed == False)
+        if unprocessed_only:
+            # Literal 0 (not a bound parameter) so SQLite can match the
+            # partial index ix_raw_unproc
+            stmt = stmt.where(RawArticleModel.processed == false())
 
-            query = query.order_by(RawArticleModel.published_at.desc())
-            models = query.all()
+        stmt = stmt.order_by(RawArticleModel.published_at.desc())
 
-            return [RawArticle.from_model(m) for m in models]
+        # Core rows skip ORM identity-map and instance-state overhead
+        with self.get_session() as session:
+            rows = session.execute(stmt).mappings()
+            return [RawArticle.from_row(row) for row in rows]
 
     def mark_articles_processed(self, article_ids: List[str]) -> None:
         """Mark articles as processed."""
@@ -119,12 +188,12 @@ class Database:
         with self.get_session() as session:
             session.query(DigestModel).filter(
                 DigestModel.id == digest_id
-            ).update({"sent_at": datetime.utcnow()}, synchronize_session=False)
+            ).update({"sent_at": _now_utc()}, synchronize_session=False)
             session.commit()
 
     def cleanup_old_articles(self, days: int = 7) -> int:
         """Remove articles older than specified days."""
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = _now_utc() - timedelta(days=days)
         with self.get_session() as session:
             count = session.query(RawArticleModel).filter(
                 RawArticleModel.fetched_at < cutoff
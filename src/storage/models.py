@@ -1,18 +1,69 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, List, Mapping, Optional
+from collections import deque
 from dataclasses import dataclass, field
+from operator import attrgetter
+import os
+import threading
 import uuid
 
+import orjson
 from sqlalchemy import (
-    Column, String, Text, DateTime, Integer, JSON, Boolean,
-    create_engine, Index
+    Column, String, Text, DateTime, Integer, Boolean,
+    create_engine, Index, text
 )
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.types import TypeDecorator
 
 
 Base = declarative_base()
 
 
+_UTC = timezone.utc
+
+
+def _now_utc() -> datetime:
+    """Current UTC time as a naive datetime, matching the stored columns."""
+    return datetime.now(_UTC).replace(tzinfo=None)
+
+
+_UUID_BATCH = 256
+_uuid_pool: deque = deque()
+_uuid_lock = threading.Lock()
+
+
+def _new_id() -> str:
+    """Return a random UUID4 string, drawing entropy 256 ids at a time."""
+    with _uuid_lock:
+        if not _uuid_pool:
+            raw = os.urandom(16 * _UUID_BATCH)
+            _uuid_pool.extend(
+                str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+                for i in range(0, len(raw), 16)
+            )
+        return _uuid_pool.popleft()
+
+
+class ORJSON(TypeDecorator):
+    """JSON column encoded with orjson.
+
+    Stored as text, so rows written by the stdlib-backed JSON type stay
+    readable.
+    """
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.dumps(value).decode("utf-8")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.loads(value)
+
+
 class RawArticleModel(Base):
     """Raw article from news source."""
     __tablename__ = "raw_articles"
@@ -27,16 +78,27 @@ class RawArticleModel(Base):
     url = Column(String(1000), unique=True, nullable=False)
     published_at = Column(DateTime, index=True)
     language = Column(String(10))
-    categories = Column(JSON, default=list)
-    fetched_at = Column(DateTime, default=datetime.utcnow)
+    categories = Column(ORJSON, default=list)
+    fetched_at = Column(DateTime, default=_now_utc)
     processed = Column(Boolean, default=False)
 
     __table_args__ = (
         Index("idx_region_published", "region", "published_at"),
         Index("idx_region_processed", "region", "processed"),
+        # Serves get_articles_for_region's unprocessed-in-window query
+        Index(
+            "ix_raw_unproc", "region", "fetched_at", "published_at",
+            sqlite_where=text("processed = 0"),
+        ),
     )
 
 
+# Columns needed to build a RawArticle (everything except the processed flag)
+RAW_ARTICLE_COLUMNS = tuple(
+    c for c in RawArticleModel.__table__.c if c.name != "processed"
+)
+
+
 class DigestModel(Base):
     """Processed news digest."""
     __tablename__ = "digests"
@@ -45,47 +107,47 @@ class DigestModel(Base):
     region = Column(String(20), index=True, nullable=False)
     region_name_ru = Column(String(50))
     summary_ru = Column(Text, nullable=False)
-    key_topics = Column(JSON, default=list)
+    key_topics = Column(ORJSON, default=list)
     article_count = Column(Integer, default=0)
-    sources_used = Column(JSON, default=list)
-    article_ids = Column(JSON, default=list)
+    sources_used = Column(ORJSON, default=list)
+    article_ids = Column(ORJSON, default=list)
     time_period = Column(String(20))
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, default=_now_utc, index=True)
     sent_at = Column(DateTime)
 
 
-@dataclass
+# RawArticle fields that map 1:1 onto RawArticleModel columns
+_RAW_FIELDS = (
+    "id", "region", "source_name", "source_url", "title", "description",
+    "content", "url", "published_at", "language", "categories", "fetched_at",
+)
+_RAW_GETTER = attrgetter(*_RAW_FIELDS)
+
+
+@dataclass(slots=True)
 class RawArticle:
     """Data class for raw article."""
     region: str
     source_name: str
     title: str
     url: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     source_url: str = ""
     description: str = ""
     content: Optional[str] = None
     published_at: Optional[datetime] = None
     language: str = "en"
     categories: List[str] = field(default_factory=list)
-    fetched_at: datetime = field(default_factory=datetime.utcnow)
+    fetched_at: datetime = field(default_factory=_now_utc)
 
     def to_model(self) -> RawArticleModel:
         """Convert to SQLAlchemy model."""
-        return RawArticleModel(
-            id=self.id,
-            region=self.region,
-            source_name=self.source_name,
-            source_url=self.source_url,
-            title=self.title,
-            description=self.description,
-            content=self.content,
-            url=self.url,
-            published_at=self.published_at,
-            language=self.language,
-            categories=self.categories,
-            fetched_at=self.fetched_at,
-        )
+        return RawArticleModel(**dict(zip(_RAW_FIELDS, _RAW_GETTER(self))))
+
+    @staticmethod
+    def to_values(articles: List["RawArticle"]) -> List[dict]:
+        """Convert to parameter dicts for a Core executemany insert."""
+        return [dict(zip(_RAW_FIELDS, _RAW_GETTER(a))) for a in articles]
 
     @classmethod
     def from_model(cls, model: RawArticleModel) -> "RawArticle":
@@ -105,20 +167,63 @@ class RawArticle:
             fetched_at=model.fetched_at,
         )
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "RawArticle":
+        """Create from a Core result row mapping of RAW_ARTICLE_COLUMNS."""
+        return cls(
+            id=row["id"],
+            region=row["region"],
+            source_name=row["source_name"],
+            source_url=row["source_url"] or "",
+            title=row["title"],
+            description=row["description"] or "",
+            content=row["content"],
+            url=row["url"],
+            published_at=row["published_at"],
+            language=row["language"] or "en",
+            categories=row["categories"] or [],
+            fetched_at=row["fetched_at"],
+        )
+
+
+@dataclass(slots=True)
+class LLMArticleRow:
+    """Article fields projected and truncated for LLM prompts."""
+    source: str
+    title: str
+    desc: str
+    date: str
+
+    @classmethod
+    def from_raw(
+        cls,
+        article: RawArticle,
+        title_limit: int = 200,
+        desc_limit: int = 500
+    ) -> "LLMArticleRow":
+        """Project a raw article, handling missing fields once."""
+        published_at = article.published_at
+        return cls(
+            source=article.source_name or "Unknown",
+            title=(article.title or "")[:title_limit],
+            desc=(article.description or "")[:desc_limit],
+            date=published_at.strftime("%Y-%m-%d %H:%M") if published_at else "",
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedDigest:
     """Data class for processed digest."""
     region: str
     summary_ru: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     region_name_ru: str = ""
     key_topics: List[str] = field(default_factory=list)
     article_count: int = 0
     sources_used: List[str] = field(default_factory=list)
     article_ids: List[str] = field(default_factory=list)
     time_period: str = "evening"
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_now_utc)
     sent_at: Optional[datetime] = None
 
     def to_model(self) -> DigestModel:
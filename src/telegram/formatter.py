@@ -1,5 +1,6 @@
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List
 
 from ..storage.models import ProcessedDigest
 from ..utils.config import get_region_info
@@ -18,6 +19,20 @@ REGION_EMOJIS = {
     "russia": "\U0001F1F7\U0001F1FA"
 }
 
+_TOPICS_HDR = "\n\n\U0001F4CC <b>Ключевые темы:</b>\n"
+_NEWS_HDR = "\n\n\U0001F4F0 <b>Главные события:</b>\n\n"
+_GLOBAL_NEWS_HDR = "\n\n\U0001F525 <b>ГЛАВНЫЕ МИРОВЫЕ СОБЫТИЯ:</b>\n\n"
+_STATS_HDR = "\n\n\U0001F4CA <b>Статистика:</b>\n"
+_GLOBAL_HEADER_TPL = "\U0001F30D <b>МИРОВОЙ ДАЙДЖЕСТ | {period}</b>\n<i>{date}</i>"
+
+
+@lru_cache(maxsize=None)
+def _header_template(region: str, region_name: str) -> str:
+    """Pre-render a regional digest header, leaving period and date to fill."""
+    emoji = REGION_EMOJIS.get(region, "\U0001F4F0")
+    name = region_name.replace("{", "{{").replace("}", "}}")
+    return f"{emoji} <b>{name} | {{period}}</b>\n<i>{{date}} MSK</i>"
+
 
 class TelegramFormatter:
     """Formats digests for Telegram messages."""
@@ -28,43 +43,53 @@ class TelegramFormatter:
 
     def format_digest(self, digest: ProcessedDigest) -> str:
         """Format a single digest for Telegram."""
-        emoji = REGION_EMOJIS.get(digest.region, "\U0001F4F0")
-        region_name = digest.region_name_ru or digest.region
-        period_name = get_time_period_ru(digest.time_period)
-        date_str = format_datetime_ru(digest.created_at)
-
-        header = f"{emoji} <b>{region_name} | {period_name}</b>\n"
-        header += f"<i>{date_str} MSK</i>"
+        header = _header_template(
+            digest.region, digest.region_name_ru or digest.region
+        ).format(
+            period=get_time_period_ru(digest.time_period),
+            date=format_datetime_ru(digest.created_at),
+        )
 
         topics_section = ""
         if digest.key_topics:
-            topics_list = "\n".join([f"\u2022 {topic}" for topic in digest.key_topics[:5]])
-            topics_section = f"\n\n\U0001F4CC <b>Ключевые темы:</b>\n{topics_list}"
-
-        news_section = f"\n\n\U0001F4F0 <b>Главные события:</b>\n\n{digest.summary_ru}"
+            topics_list = "\n".join(f"\u2022 {topic}" for topic in digest.key_topics[:5])
+            topics_section = _TOPICS_HDR + topics_list
 
-        stats = f"\n\n\U0001F4CA <b>Статистика:</b>\n"
-        stats += f"\u2022 Источников: {len(digest.sources_used)} | "
-        stats += f"Статей: {digest.article_count}"
+        sources_used = digest.sources_used
+        stats = f"\u2022 Источников: {len(sources_used)} | Статей: {digest.article_count}"
 
-        sources_str = ", ".join(digest.sources_used[:5])
-        if len(digest.sources_used) > 5:
-            sources_str += f" (+{len(digest.sources_used) - 5})"
-        sources = f"\n\n<i>Источники: {sources_str}</i>"
+        sources_str = ", ".join(sources_used[:5])
+        if len(sources_used) > 5:
+            sources_str += f" (+{len(sources_used) - 5})"
 
-        message = header + self.separator + topics_section + self.separator + news_section + self.separator + stats + sources
+        sep = self.separator
+        message = "".join((
+            header, sep, topics_section, sep,
+            _NEWS_HDR, digest.summary_ru, sep,
+            _STATS_HDR, stats,
+            "\n\n<i>Источники: ", sources_str, "</i>",
+        ))
 
-        if len(message) > self.max_length:
-            message = self._truncate_message(message)
+        if self._exceeds_limit(message):
+            message = self._do_truncate(message)
 
         return message
 
-    def _truncate_message(self, message: str) -> str:
-        """Truncate message to fit Telegram limits."""
-        if len(message) <= self.max_length:
-            return message
-
-        truncated = message[:self.max_length - 50]
+    def _exceeds_limit(self, message: str) -> bool:
+        """Check the message against Telegram's limit in UTF-16 code units."""
+        length = len(message)
+        if length > self.max_length:
+            return True
+        # Every character takes at most two code units
+        if length * 2 <= self.max_length:
+            return False
+        return len(message.encode("utf-16-le")) // 2 > self.max_length
+
+    def _do_truncate(self, message: str) -> str:
+        """Truncate a message already known to exceed Telegram limits."""
+        # Cut by UTF-16 code units, dropping a surrogate pair split in half
+        limit = (self.max_length - 50) * 2
+        truncated = message.encode("utf-16-le")[:limit].decode("utf-16-le", errors="ignore")
         last_newline = truncated.rfind('\n')
         if last_newline > self.max_length // 2:
             truncated = truncated[:last_newline]
@@ -74,38 +99,39 @@ class TelegramFormatter:
     def format_multiple_digests(
         self,
         digests: List[ProcessedDigest]
-    ) -> List[str]:
-        """Format multiple digests as separate messages."""
-        return [self.format_digest(d) for d in digests if d]
+    ) -> Iterator[str]:
+        """Format multiple digests as separate messages, one at a time."""
+        return (self.format_digest(d) for d in digests if d)
 
     def format_global_digest(self, digest: ProcessedDigest) -> str:
         """Format the global digest for Telegram."""
-        emoji = "\U0001F30D"
-        period_name = get_time_period_ru(digest.time_period)
-        date_str = format_datetime_ru(digest.created_at)
-
-        header = f"{emoji} <b>МИРОВОЙ ДАЙДЖЕСТ | {period_name}</b>\n"
-        header += f"<i>{date_str}</i>"
+        header = _GLOBAL_HEADER_TPL.format(
+            period=get_time_period_ru(digest.time_period),
+            date=format_datetime_ru(digest.created_at),
+        )
 
         topics_section = ""
         if digest.key_topics:
-            topics_list = "\n".join([f"\u2022 {topic}" for topic in digest.key_topics[:5]])
-            topics_section = f"\n\n\U0001F4CC <b>Ключевые темы:</b>\n{topics_list}"
-
-        news_section = f"\n\n\U0001F525 <b>ГЛАВНЫЕ МИРОВЫЕ СОБЫТИЯ:</b>\n\n{digest.summary_ru}"
-
-        stats = f"\n\n\U0001F4CA <b>Статистика:</b>\n"
-        stats += f"\u2022 Регионов: 8 | Статей: {digest.article_count}"
-
-        sources_str = ", ".join(digest.sources_used[:8])
-        if len(digest.sources_used) > 8:
-            sources_str += f" (+{len(digest.sources_used) - 8})"
-        sources = f"\n\n<i>Источники: {sources_str}</i>"
-
-        message = header + self.separator + topics_section + self.separator + news_section + self.separator + stats + sources
-
-        if len(message) > self.max_length:
-            message = self._truncate_message(message)
+            topics_list = "\n".join(f"\u2022 {topic}" for topic in digest.key_topics[:5])
+            topics_section = _TOPICS_HDR + topics_list
+
+        stats = f"\u2022 Регионов: 8 | Статей: {digest.article_count}"
+
+        sources_used = digest.sources_used
+        sources_str = ", ".join(sources_used[:8])
+        if len(sources_used) > 8:
+            sources_str += f" (+{len(sources_used) - 8})"
+
+        sep = self.separator
+        message = "".join((
+            header, sep, topics_section, sep,
+            _GLOBAL_NEWS_HDR, digest.summary_ru, sep,
+            _STATS_HDR, stats,
+            "\n\n<i>Источники: ", sources_str, "</i>",
+        ))
+
+        if self._exceeds_limit(message):
+            message = self._do_truncate(message)
 
         return message
 
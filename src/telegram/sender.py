@@ -1,9 +1,12 @@
 import asyncio
+from datetime import timedelta
+from functools import lru_cache
 from typing import List, Optional
 
 from telegram import Bot
 from telegram.constants import ParseMode
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 
 from ..storage.models import ProcessedDigest
 from ..storage.database import Database
@@ -16,6 +19,15 @@ from .formatter import TelegramFormatter
 logger = get_logger("telegram_sender")
 
 
+@lru_cache(maxsize=1)
+def _get_bot(token: str) -> Bot:
+    """Get a Bot whose HTTP/2 connection pool is shared by all senders."""
+    return Bot(
+        token=token,
+        request=HTTPXRequest(connection_pool_size=16, http_version="2")
+    )
+
+
 class TelegramSender:
     """Sends news digests to Telegram."""
 
@@ -23,7 +35,7 @@ class TelegramSender:
         settings = get_settings()
         config = get_config()
 
-        self.bot = Bot(token=settings.telegram_bot_token)
+        self.bot = _get_bot(settings.telegram_bot_token)
         self.chat_ids = settings.get_chat_ids()  # Support multiple users
         self.formatter = TelegramFormatter()
         self.db = db or Database()
@@ -31,6 +43,9 @@ class TelegramSender:
         self.retry_attempts = config["telegram"]["retry_attempts"]
         self.retry_delay = config["telegram"]["retry_delay_seconds"]
 
+        # Stay under Telegram's global limit of ~30 messages per second
+        self._send_sem = asyncio.Semaphore(25)
+
     async def send_digest(self, digest: ProcessedDigest) -> bool:
         """Send a single digest to Telegram."""
         message = self.formatter.format_digest(digest)
@@ -56,15 +71,38 @@ class TelegramSender:
     async def send_digests(
         self,
         digests: List[ProcessedDigest],
-        delay_between: float = 2.0
+        delay_between: float = 0.0
     ) -> dict:
-        """Send multiple digests with delay between each."""
-        results = {}
+        """Send multiple digests, in order, to every chat.
+
+        Each chat receives the digests one after another so they arrive in
+        the given order; different chats are served concurrently. Rate
+        limiting is left to _send_to_chat, which waits out RetryAfter.
+        """
+        digests = [d for d in digests if d]
+        if not self.chat_ids:
+            logger.error("No chat IDs configured")
+            return {d.region: False for d in digests}
+
+        messages = [self.formatter.format_digest(d) for d in digests]
 
-        for digest in digests:
-            if digest:
-                results[digest.region] = await self.send_digest(digest)
-                await asyncio.sleep(delay_between)
+        async def _send_all(chat_id: str) -> List[bool]:
+            sent = []
+            for i, message in enumerate(messages):
+                if i and delay_between:
+                    await asyncio.sleep(delay_between)
+                sent.append(await self._send_to_chat(message, chat_id))
+            return sent
+
+        per_chat = await asyncio.gather(*(_send_all(c) for c in self.chat_ids))
+
+        results = {}
+        for i, digest in enumerate(digests):
+            success = all(sent[i] for sent in per_chat)
+            if success:
+                self.db.mark_digest_sent(digest.id)
+                logger.info(f"Sent digest for {digest.region}")
+            results[digest.region] = success
 
         return results
 
@@ -74,26 +112,37 @@ class TelegramSender:
             logger.error("No chat IDs configured")
             return False
 
-        all_success = True
-        for chat_id in self.chat_ids:
-            success = await self._send_to_chat(text, chat_id)
-            if not success:
-                all_success = False
+        results = await asyncio.gather(
+            *(self._send_to_chat(text, chat_id) for chat_id in self.chat_ids),
+            return_exceptions=True
+        )
 
-        return all_success
+        return all(r is True for r in results)
 
     async def _send_to_chat(self, text: str, chat_id: str) -> bool:
         """Send a message to a single chat ID with retry logic."""
         for attempt in range(self.retry_attempts):
             try:
-                await self.bot.send_message(
-                    chat_id=chat_id,
-                    text=text,
-                    parse_mode=ParseMode.HTML,
-                    disable_web_page_preview=True
-                )
+                async with self._send_sem:
+                    await self.bot.send_message(
+                        chat_id=chat_id,
+                        text=text,
+                        parse_mode=ParseMode.HTML,
+                        disable_web_page_preview=True
+                    )
                 return True
 
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                logger.warning(f"Rate limited for {chat_id}, retrying in {retry_after}s")
+
+                if attempt < self.retry_attempts - 1:
+                    await asyncio.sleep(retry_after)
+                else:
+                    return False
+
             except TelegramError as e:
                 logger.error(f"Telegram error for {chat_id} (attempt {attempt + 1}): {e}")
 
@@ -13,6 +13,7 @@ from .config import (
     get_config,
     get_region_info,
     load_region_sources,
+    config_cache_clear,
 )
 
 __all__ = [
@@ -29,4 +30,5 @@ __all__ = [
     "get_config",
     "get_region_info",
     "load_region_sources",
+    "config_cache_clear",
 ]
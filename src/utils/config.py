@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -7,6 +8,11 @@ from dotenv import load_dotenv
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 load_dotenv()
 
@@ -31,16 +37,18 @@ class Settings(BaseSettings):
         return [cid.strip() for cid in self.telegram_chat_id.split(",") if cid.strip()]
 
 
+@lru_cache(maxsize=None)
 def load_yaml_config(config_path: str = "config/config.yaml") -> dict:
-    """Load YAML configuration file."""
+    """Load YAML configuration file (parsed once per path)."""
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
+@lru_cache(maxsize=None)
 def load_region_sources(region: str) -> dict:
     """Load sources configuration for a specific region."""
     config_path = Path(f"config/sources/{region}.yaml")
@@ -48,20 +56,36 @@ def load_region_sources(region: str) -> dict:
         return {"rss_sources": [], "api_sources": []}
 
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_YamlLoader) or {}
 
 
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """Get application settings singleton."""
     return Settings()
 
 
+@lru_cache(maxsize=None)
 def get_config() -> dict:
-    """Get full application configuration."""
+    """Get full application configuration (parsed once per process)."""
     return load_yaml_config()
 
 
+@lru_cache(maxsize=None)
+def _region_info() -> dict:
+    """Flat region -> info mapping, built from the config on first use."""
+    return dict(get_config().get("region_info") or {})
+
+
 def get_region_info(region: str) -> dict:
     """Get information about a specific region."""
-    config = get_config()
-    return config.get("region_info", {}).get(region, {})
+    return _region_info().get(region, {})
+
+
+def config_cache_clear() -> None:
+    """Forget cached settings and configuration so they are re-read."""
+    get_settings.cache_clear()
+    load_yaml_config.cache_clear()
+    get_config.cache_clear()
+    _region_info.cache_clear()
+    load_region_sources.cache_clear()
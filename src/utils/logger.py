@@ -1,9 +1,23 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
 
+# Listeners started by setup_logger and not yet stopped
+_running_listeners = set()
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Flush and stop a queue listener unless it was stopped already."""
+    if listener in _running_listeners:
+        _running_listeners.discard(listener)
+        listener.stop()
+
+
 def setup_logger(
     name: str = "news_aggregator",
     log_level: str = "INFO",
@@ -23,7 +37,6 @@ def setup_logger(
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
@@ -31,7 +44,18 @@ def setup_logger(
     log_file = log_path / f"news_{datetime.now().strftime('%Y%m%d')}.log"
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # Writes happen on the listener's thread so slow I/O never blocks the loop
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    _running_listeners.add(listener)
+    atexit.register(_stop_listener, listener)
+    logger._listener = listener
 
     return logger
 
@@ -1,8 +1,21 @@
 from datetime import datetime, timezone as tz
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import Optional
 
 
+_MONTHS_RU = (
+    "января", "февраля", "марта", "апреля", "мая", "июня",
+    "июля", "августа", "сентября", "октября", "ноября", "декабря"
+)
+
+# Digest period for each hour of the day: morning 5-11, afternoon 12-17
+_HOUR_BUCKET = (
+    ("evening",) * 5 + ("morning",) * 7 + ("afternoon",) * 6 + ("evening",) * 6
+)
+
+
+@lru_cache(maxsize=64)
 def get_timezone(timezone_name: str) -> ZoneInfo:
     """Get ZoneInfo object for timezone name."""
     return ZoneInfo(timezone_name)
@@ -31,28 +44,18 @@ def convert_timezone(
 
 def format_datetime_ru(dt: datetime, include_time: bool = True) -> str:
     """Format datetime in Russian style."""
-    months_ru = [
-        "января", "февраля", "марта", "апреля", "мая", "июня",
-        "июля", "августа", "сентября", "октября", "ноября", "декабря"
-    ]
-
     day = dt.day
-    month = months_ru[dt.month - 1]
+    month = _MONTHS_RU[dt.month - 1]
     year = dt.year
 
     if include_time:
-        return f"{day} {month} {year}, {dt.strftime('%H:%M')}"
+        return f"{day} {month} {year}, {dt.hour:02d}:{dt.minute:02d}"
     return f"{day} {month} {year}"
 
 
 def get_time_period(hour: int) -> str:
     """Determine time period based on hour."""
-    if 5 <= hour < 12:
-        return "morning"
-    elif 12 <= hour < 18:
-        return "afternoon"
-    else:
-        return "evening"
+    return _HOUR_BUCKET[hour]
 
 
 def get_time_period_ru(period: str) -> str:
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("datasketch")
+pytest.importorskip("sqlalchemy")
+
+from src.aggregator.deduplicator import DeduplicationIndex, Deduplicator
+from src.storage.models import RawArticle
+
+
+def _article(
+    title: str,
+    url: str,
+    region: str = "usa",
+    published_at: datetime = datetime(2024, 5, 1, 12, 0)
+) -> RawArticle:
+    return RawArticle(
+        region=region,
+        source_name="Test",
+        title=title,
+        url=url,
+        published_at=published_at,
+    )
+
+
+def test_deduplicate_keeps_newest_of_near_duplicate_titles():
+    articles = [
+        _article("Markets rally as Fed holds interest rates", "https://a/1"),
+        _article(
+            "Markets rally as Fed holds interest rates!", "https://b/1",
+            published_at=datetime(2024, 5, 1, 9, 0),
+        ),
+        _article("Earthquake hits northern Japan", "https://a/2"),
+        _article("Earthquake hits northern Japan", "https://a/2"),
+    ]
+
+    unique = Deduplicator().deduplicate(articles)
+
+    assert sorted(a.url for a in unique) == ["https://a/1", "https://a/2"]
+
+
+def test_index_rejects_duplicates_across_batches():
+    index = Deduplicator().create_index()
+    assert isinstance(index, DeduplicationIndex)
+
+    first = index.add([_article("Elections set for next spring", "https://a/1")])
+    second = index.add([
+        _article("Elections set for next spring.", "https://b/1", region="europe"),
+        _article("New vaccine approved by regulators", "https://b/2", region="europe"),
+    ])
+
+    assert [a.url for a in first] == ["https://a/1"]
+    assert [a.url for a in second] == ["https://b/2"]
@@ -0,0 +1,29 @@
+import time
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("feedparser")
+pytest.importorskip("httpx")
+
+from src.parsers.rss_parser import RSSParser
+
+
+def test_parse_date_skips_leap_second_to_next_field():
+    entry = {
+        "published": "Sat, 31 Dec 2016 23:59:60 +0000",
+        "published_parsed": time.struct_time((2016, 12, 31, 23, 59, 60, 5, 366, 0)),
+        "updated": "Sun, 01 Jan 2017 00:05:00 +0000",
+        "updated_parsed": time.struct_time((2017, 1, 1, 0, 5, 0, 6, 1, 0)),
+    }
+
+    assert RSSParser()._parse_date(entry) == datetime(2017, 1, 1, 0, 5)
+
+
+def test_parse_date_returns_none_when_every_field_is_invalid():
+    entry = {
+        "published": "Mon, 31 Jun 2024 10:00:00 +0000",
+        "published_parsed": time.struct_time((2024, 6, 31, 10, 0, 0, 0, 183, 0)),
+    }
+
+    assert RSSParser()._parse_date(entry) is None
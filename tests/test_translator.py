@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip("openai")
+
+from src.aggregator import translator as translator_module
+from src.aggregator.translator import Translator
+from src.llm.client import LLMClient
+
+
+@pytest.mark.asyncio
+async def test_empty_batch_reply_falls_back_to_per_text(monkeypatch):
+    calls = []
+
+    async def complete(messages, json_mode=False, **kwargs):
+        calls.append(json_mode)
+        # The batch request comes back empty, the single-text ones succeed
+        return None if json_mode else " перевод "
+
+    llm = LLMClient.__new__(LLMClient)
+    llm.max_tokens_translation = 1024
+    monkeypatch.setattr(llm, "complete", complete)
+    monkeypatch.setattr(translator_module, "get_llm_client", lambda: llm)
+
+    result = await Translator().translate_summary(
+        {
+            "key_topics": ["economy"],
+            "stories": [{"headline": "Markets rally", "summary": "Stocks rose."}],
+        },
+        source_language="en",
+    )
+
+    assert calls == [True, False, False, False]
+    assert result == {
+        "key_topics": ["перевод"],
+        "stories": [{"headline": "перевод", "summary": "перевод"}],
+    }